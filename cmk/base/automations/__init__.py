@@ -46,6 +46,7 @@ class Automations:
     def __init__(self) -> None:
         super().__init__()
         self._automations: dict[str, Automation] = {}
+        self._plugins_loaded = False
 
     def register(self, automation: "Automation") -> None:
         if automation.cmd is None:
@@ -64,16 +65,19 @@ class Automations:
                     f" (available: {', '.join(sorted(self._automations))})"
                 )
 
-            if automation.needs_checks:
+            if automation.needs_checks and not self._plugins_loaded:
                 with (
                     tracer.start_as_current_span("load_all_plugins"),
-                    redirect_stdout(open(os.devnull, "w")),
+                    open(os.devnull, "w") as devnull,
+                    redirect_stdout(devnull),
                 ):
                     log.setup_console_logging()
                     config.load_all_plugins(
                         local_checks_dir=paths.local_checks_dir,
                         checks_dir=paths.checks_dir,
                     )
+                # The plugins do not change during the lifetime of the process, the config might.
+                self._plugins_loaded = True
 
             if automation.needs_config:
                 with tracer.start_as_current_span("load_config"):
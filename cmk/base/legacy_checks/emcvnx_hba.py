@@ -70,30 +70,29 @@ from cmk.agent_based.v2 import get_rate, get_value_store
 check_info = {}
 
 
-def saveint(i: str) -> int:
-    """Tries to cast a string to an integer and return it. In case this
-    fails, it returns 0.
-
-    Advice: Please don't use this function in new code. It is understood as
-    bad style these days, because in case you get 0 back from this function,
-    you can not know whether it is really 0 or something went wrong."""
-    try:
-        return int(i)
-    except (TypeError, ValueError):
-        return 0
+_BLOCKS_KEYS = {
+    "Read:": "Blocks Read",
+    "Written:": "Blocks Written",
+}
 
 
 def parse_emcvnx_hba(string_table):
     parsed = {}
     for line in string_table:
-        if len(line) > 2 and line[0] == "SP" and line[1] == "Name:":
-            hba_id = " ".join(line[2:])
-        elif len(line) > 2 and line[0] == "SP" and line[1] == "Port" and line[2] == "ID:":
-            hba_id += " Port " + line[-1]
-            hba = {}
-            parsed[hba_id] = hba
-        elif len(line) > 2 and line[0] == "Blocks" and line[1] in ("Read:", "Written:"):
-            hba["Blocks " + line[1].replace(":", "")] = saveint(line[-1])
+        if len(line) < 3:
+            continue
+        match line[0], line[1]:
+            case "SP", "Name:":
+                hba_id = " ".join(line[2:])
+            case "SP", "Port" if line[2] == "ID:":
+                hba_id += " Port " + line[-1]
+                hba = {}
+                parsed[hba_id] = hba
+            case "Blocks", ("Read:" | "Written:") as counter:
+                try:
+                    hba[_BLOCKS_KEYS[counter]] = int(line[-1])
+                except ValueError:
+                    hba[_BLOCKS_KEYS[counter]] = 0
     return parsed
 
 
@@ -112,14 +111,22 @@ def check_emcvnx_hba(item, _no_params, parsed):
 
     read_blocks = parsed[item]["Blocks Read"]
     write_blocks = parsed[item]["Blocks Written"]
-    countername_r = "emcvnx_hba.read_blocks.%s" % item.replace(" ", "_")
-    countername_w = "emcvnx_hba.write_blocks.%s" % item.replace(" ", "_")
+    counter_item = item.replace(" ", "_")
+    value_store = get_value_store()
 
     read_blocks_per_sec = get_rate(
-        get_value_store(), countername_r, now, read_blocks, raise_overflow=True
+        value_store,
+        f"emcvnx_hba.read_blocks.{counter_item}",
+        now,
+        read_blocks,
+        raise_overflow=True,
     )
     write_blocks_per_sec = get_rate(
-        get_value_store(), countername_w, now, write_blocks, raise_overflow=True
+        value_store,
+        f"emcvnx_hba.write_blocks.{counter_item}",
+        now,
+        write_blocks,
+        raise_overflow=True,
     )
     perfdata.append(("read_blocks", read_blocks_per_sec))
     perfdata.append(("write_blocks", write_blocks_per_sec))
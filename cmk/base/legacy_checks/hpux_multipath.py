@@ -53,20 +53,29 @@ hpux_multipath_pathstates = {
     "CLOSING": 1,
 }
 
+# OPENING and CLOSING are only aliases when parsing, every counter is reported once
+_PATHSTATUS_NAMES = (
+    (0, "ACTIVE"),
+    (1, "STANDBY"),
+    (2, "FAILED"),
+    (3, "UNOPEN"),
+)
+
 
 def parse_hpux_multipath(info):
     disks = {}
+    # The agent only sends lines starting with "LUN PATH", "World Wide Identifier" or "State",
+    # so the first word is enough to tell them apart.
     for line in info:
-        if ":" in line:
-            disk = line[-1]
-        elif line[0] == "World":
-            wwid = line[-1]
-            paths = [0, 0, 0, 0]  # ACTIVE, STANBY, FAILED, UNOPEN
-            disks[wwid] = (disk, paths)
-        elif "=" in line:
-            state = line[-1]
-            paths[hpux_multipath_pathstates[state]] += 1
-    return disks
+        match line[0]:
+            case "State":
+                paths[hpux_multipath_pathstates[line[-1]]] += 1
+            case "World":
+                paths = [0, 0, 0, 0]  # ACTIVE, STANBY, FAILED, UNOPEN
+                disks[line[-1]] = (disk, paths)
+            case "LUN":
+                disk = line[-1]
+    return {wwid: (disk, tuple(paths)) for wwid, (disk, paths) in disks.items()}
 
 
 def inventory_hpux_multipath(parsed):
@@ -76,12 +85,7 @@ def inventory_hpux_multipath(parsed):
 
 
 def hpux_multipath_format_pathstatus(pathcounts):
-    infos = []
-    for name, i in hpux_multipath_pathstates.items():
-        c = pathcounts[i]
-        if c > 0:
-            infos.append("%d %s" % (c, name))
-    return ", ".join(infos)
+    return ", ".join(f"{pathcounts[i]} {name}" for i, name in _PATHSTATUS_NAMES if pathcounts[i])
 
 
 def check_hpux_multipath(item, params, parsed):
@@ -99,7 +103,7 @@ def check_hpux_multipath(item, params, parsed):
         return
 
     expected = params["expected"]
-    if list(pathcounts) != list(expected):
+    if pathcounts != tuple(expected):
         yield (
             1,
             "%s: Invalid path status %s (should be %s)"
@@ -21,7 +21,7 @@ def inventory_solaris_prtdiag_status(info):
 
 
 def check_solaris_prtdiag_status(_no_item, _no_params, info):
-    if not info:
+    if not info or not info[0]:
         return None
 
     # 0 No failures or errors are detected in the system.
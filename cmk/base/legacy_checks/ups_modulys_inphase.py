@@ -16,24 +16,26 @@ check_info = {}
 def parse_ups_modulys_inphase(string_table):
     if not string_table:
         return None
+
+    row = string_table[0]
     parsed = {}
     parsed["Phase 1"] = {
-        "frequency": int(string_table[0][1]) / 10.0,
-        "voltage": int(string_table[0][2]) / 10.0,
-        "current": int(string_table[0][3]) / 10.0,
+        "frequency": int(row[1]) / 10.0,
+        "voltage": int(row[2]) / 10.0,
+        "current": int(row[3]) / 10.0,
     }
 
-    if string_table[0][0] == "3":
+    if row[0] == "3":
         parsed["Phase 2"] = {
-            "frequency": int(string_table[0][4]) / 10.0,
-            "voltage": int(string_table[0][5]) / 10.0,
-            "current": int(string_table[0][6]) / 10.0,
+            "frequency": int(row[4]) / 10.0,
+            "voltage": int(row[5]) / 10.0,
+            "current": int(row[6]) / 10.0,
         }
 
         parsed["Phase 3"] = {
-            "frequency": int(string_table[0][7]) / 10.0,
-            "voltage": int(string_table[0][8]) / 10.0,
-            "current": int(string_table[0][9]) / 10.0,
+            "frequency": int(row[7]) / 10.0,
+            "voltage": int(row[8]) / 10.0,
+            "current": int(row[9]) / 10.0,
         }
 
     return parsed
@@ -3,6 +3,7 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
+from operator import itemgetter
 
 from cmk.base.check_legacy_includes.elphase import check_elphase
 
@@ -13,41 +14,42 @@ from cmk.plugins.lib.ups_modulys import DETECT_UPS_MODULYS
 check_info = {}
 
 
+# Columns of voltage, current, power and output load per phase
+_PHASE_COLUMNS = (
+    ("Phase 1", itemgetter(3, 4, 5, 6)),
+    ("Phase 2", itemgetter(7, 8, 9, 10)),
+    ("Phase 3", itemgetter(11, 12, 13, 14)),
+)
+
+
 def parse_ups_modulys_outphase(string_table):
     if not string_table:
         return None
 
-    parsed = {}
-    parsed["Phase 1"] = {
-        "frequency": int(string_table[0][1]) / 10.0,
-        "voltage": int(string_table[0][3]) / 10.0,
-        "current": int(string_table[0][4]) / 10.0,
-        "power": int(string_table[0][5]),
-        "output_load": int(string_table[0][6]),
-    }
-
-    if string_table[0][2] == "3":
-        parsed["Phase 2"] = {
-            "frequency": int(string_table[0][1]) / 10.0,
-            "voltage": int(string_table[0][7]) / 10.0,
-            "current": int(string_table[0][8]) / 10.0,
-            "power": int(string_table[0][9]),
-            "output_load": int(string_table[0][10]),
-        }
+    row = string_table[0]
+    frequency = int(row[1]) / 10.0
+    num_phases = 3 if row[2] == "3" else 1
 
-        parsed["Phase 3"] = {
-            "frequency": int(string_table[0][1]) / 10.0,
-            "voltage": int(string_table[0][11]) / 10.0,
-            "current": int(string_table[0][12]) / 10.0,
-            "power": int(string_table[0][13]),
-            "output_load": int(string_table[0][14]),
+    parsed = {}
+    for phase, columns in _PHASE_COLUMNS[:num_phases]:
+        voltage, current, power, output_load = map(int, columns(row))
+        parsed[phase] = {
+            "frequency": frequency,
+            "voltage": voltage / 10.0,
+            "current": current / 10.0,
+            "power": power,
+            "output_load": output_load,
         }
 
     return parsed
 
 
+# Discovered parameters are only ever read, so all services can share the same empty dict
+_NO_PARAMETERS: dict = {}
+
+
 def discover_ups_modulys_outphase(section):
-    yield from ((item, {}) for item in section)
+    yield from ((item, _NO_PARAMETERS) for item in section)
 
 
 check_info["ups_modulys_outphase"] = LegacyCheckDefinition(
@@ -131,6 +131,16 @@ class DiscoveredItem(Generic[_DiscoveredItem]):
 class QualifiedDiscovery(Generic[_DiscoveredItem]):
     """Classify items into "new", "unchanged", "changed", and "vanished" ones."""
 
+    __slots__ = (
+        "preexisting",
+        "current",
+        "_vanished",
+        "_new",
+        "_changed",
+        "_unchanged",
+        "_old",
+    )
+
     def __init__(
         self,
         *,
@@ -143,26 +153,29 @@ class QualifiedDiscovery(Generic[_DiscoveredItem]):
         current_dict = {v.id(): v for v in current}
         preexisting_dict = {v.id(): v for v in preexisting}
 
-        self._vanished: Final = [
-            DiscoveredItem(previous=v, new=None)
-            for k, v in preexisting_dict.items()
-            if k not in current_dict
-        ]
-        self._new: Final = [
-            DiscoveredItem(previous=None, new=v)
-            for k, v in current_dict.items()
-            if k not in preexisting_dict
-        ]
-        self._changed: Final = [
-            DiscoveredItem(previous=v, new=current_dict[k])
-            for k, v in preexisting_dict.items()
-            if k in current_dict and v.comparator() != current_dict[k].comparator()
-        ]
-        self._unchanged: Final = [
-            DiscoveredItem(previous=v, new=v)
-            for k, v in current_dict.items()
-            if k in preexisting_dict and v.comparator() == preexisting_dict[k].comparator()
-        ]
+        # Two passes in total, and the comparators of every pair are only compared once.
+        vanished: list[DiscoveredItem[_DiscoveredItem]] = []
+        changed: list[DiscoveredItem[_DiscoveredItem]] = []
+        changed_ids: set[Hashable] = set()
+        for k, v in preexisting_dict.items():
+            if k not in current_dict:
+                vanished.append(DiscoveredItem(previous=v, new=None))
+            elif v.comparator() != (c := current_dict[k]).comparator():
+                changed.append(DiscoveredItem(previous=v, new=c))
+                changed_ids.add(k)
+
+        new: list[DiscoveredItem[_DiscoveredItem]] = []
+        unchanged: list[DiscoveredItem[_DiscoveredItem]] = []
+        for k, v in current_dict.items():
+            if k not in preexisting_dict:
+                new.append(DiscoveredItem(previous=None, new=v))
+            elif k not in changed_ids:
+                unchanged.append(DiscoveredItem(previous=v, new=v))
+
+        self._vanished: Final = vanished
+        self._new: Final = new
+        self._changed: Final = changed
+        self._unchanged: Final = unchanged
         self._old: Final = self._changed + self._unchanged
 
     @classmethod
@@ -10,10 +10,8 @@ import dataclasses
 from collections.abc import Mapping
 from typing import Any
 
-from cmk.utils.datastructures import denilled
 from cmk.utils.global_ident_type import is_locked_by_quick_setup
 from cmk.utils.labels import LabelGroups
-from cmk.utils.object_diff import make_diff_text
 from cmk.utils.rulesets.conditions import (
     allow_host_label_conditions,
     allow_service_label_conditions,
@@ -21,6 +19,7 @@ from cmk.utils.rulesets.conditions import (
 from cmk.utils.rulesets.ruleset_matcher import RuleOptionsSpec
 
 from cmk.gui import exceptions, http
+from cmk.gui.hooks import request_memoize
 from cmk.gui.i18n import _l
 from cmk.gui.logged_in import user
 from cmk.gui.openapi.endpoints.common_fields import field_include_extensions, field_include_links
@@ -46,18 +45,17 @@ from cmk.gui.openapi.utils import (
 from cmk.gui.utils import gen_id
 from cmk.gui.utils import permission_verification as permissions
 from cmk.gui.utils.escaping import strip_tags
+from cmk.gui.valuespec import ValueSpec
 from cmk.gui.watolib.changes import add_change
 from cmk.gui.watolib.hosts_and_folders import Folder
 from cmk.gui.watolib.rulesets import (
     AllRulesets,
-    FolderRulesets,
     Rule,
     RuleConditions,
     RuleOptions,
     Ruleset,
     RulesetCollection,
     visible_ruleset,
-    visible_rulesets,
 )
 
 
@@ -81,8 +79,24 @@ RW_PERMISSIONS = permissions.AllPerm(
 )
 
 
+@request_memoize()
+def _load_all_rulesets() -> AllRulesets:
+    """Load all rulesets, at most once per request
+
+    Rules saved through the returned collection keep it up to date. Whoever saves rules through
+    another collection has to clear the cache afterwards.
+    """
+    return AllRulesets.load_all_rulesets()
+
+
+@request_memoize()
+def _valuespec(ruleset: Ruleset) -> ValueSpec:
+    # Building the valuespec is expensive and list_rules needs it for every rule of the ruleset
+    return ruleset.valuespec()
+
+
 # NOTE: This is a dataclass and no namedtuple because it needs to be mutable. See `move_rule_to`
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RuleEntry:
     rule: Rule
     ruleset: Ruleset
@@ -172,19 +186,20 @@ def move_rule_to(param: Mapping[str, Any]) -> http.Response:
             )
 
     dest_folder.permissions.need_permission("write")
+    source_folder = source_entry.folder
     source_entry.ruleset.move_to_folder(source_entry.rule, dest_folder, index)
     source_entry.folder = dest_folder
     all_rulesets.save()
-    affected_sites = source_entry.folder.all_site_ids()
+    affected_sites = source_folder.all_site_ids()
 
-    if dest_folder != source_entry.folder:
+    if dest_folder is not source_folder:
         affected_sites.extend(dest_folder.all_site_ids())
 
     add_change(
         "edit-rule",
         _l('Changed properties of rule "%s", moved from folder "%s" to top of folder "%s"')
-        % (source_entry.rule.id, source_entry.folder.title(), dest_folder.title()),
-        sites=list(set(affected_sites)),
+        % (source_entry.rule.id, source_folder.title(), dest_folder.title()),
+        sites=list(dict.fromkeys(affected_sites)),
         object_ref=source_entry.rule.object_ref(),
     )
 
@@ -211,8 +226,8 @@ def create_rule(param):
     folder: Folder = body["folder"]
     folder.permissions.need_permission("write")
 
-    rulesets = FolderRulesets.load_folder_rulesets(folder)
-    ruleset = _retrieve_from_rulesets(rulesets, ruleset_name)
+    all_rulesets = _load_all_rulesets()
+    ruleset = _retrieve_from_rulesets(all_rulesets, ruleset_name)
 
     try:
         _validate_value(ruleset, value)
@@ -229,7 +244,7 @@ def create_rule(param):
     )
 
     index = ruleset.append_rule(folder, rule)
-    rulesets.save_folder()
+    all_rulesets.save_folder(folder)
     # TODO Duplicated code is in pages/rulesets.py:2670-
     # TODO Move to
     add_change(
@@ -237,10 +252,16 @@ def create_rule(param):
         _l('Created new rule #%d in ruleset "%s" in folder "%s"')
         % (index, ruleset.title(), folder.alias_path()),
         sites=folder.all_site_ids(),
-        diff_text=make_diff_text({}, rule.to_log()),
+        diff_text=ruleset.diff_rules(None, rule),
         object_ref=rule.object_ref(),
     )
-    rule_entry = _get_rule_by_id(rule.id)
+    rule_entry = RuleEntry(
+        rule=rule,
+        ruleset=ruleset,
+        all_rulesets=all_rulesets,
+        index_nr=index,
+        folder=folder,
+    )
     return serve_json(_serialize_rule(rule_entry))
 
 
@@ -255,7 +276,7 @@ def create_rule(param):
 def list_rules(param):
     """List rules"""
     user.need_permission("wato.rulesets")
-    all_rulesets = AllRulesets.load_all_rulesets()
+    all_rulesets = _load_all_rulesets()
     ruleset_name = param["ruleset_name"]
     include_links: bool = param["include_links"]
     include_extensions: bool = param["include_extensions"]
@@ -303,23 +324,31 @@ def show_rule(param):
     return serve_json(_serialize_rule(rule_entry))
 
 
+def _find_rule(rule_uuid: str, all_rulesets: AllRulesets) -> RuleEntry | None:
+    for ruleset in all_rulesets.get_rulesets().values():
+        try:
+            rule = ruleset.get_rule_by_id(rule_uuid)
+        except KeyError:
+            continue
+        # Only check the visibility of rulesets actually holding the rule
+        if not visible_ruleset(ruleset.rulespec.name):
+            continue
+        return RuleEntry(
+            index_nr=ruleset.get_folder_rules(rule.folder).index(rule),
+            rule=rule,
+            folder=rule.folder,
+            ruleset=ruleset,
+            all_rulesets=all_rulesets,
+        )
+    return None
+
+
 def _get_rule_by_id(rule_uuid: str, all_rulesets: AllRulesets | None = None) -> RuleEntry:
     if all_rulesets is None:
-        all_rulesets = AllRulesets.load_all_rulesets()
-
-    for ruleset in visible_rulesets(all_rulesets.get_rulesets()).values():
-        folder: Folder
-        index: int
-        rule: Rule
-        for folder, index, rule in ruleset.get_rules():
-            if rule.id == rule_uuid:
-                return RuleEntry(
-                    index_nr=index,
-                    rule=rule,
-                    folder=folder,
-                    ruleset=ruleset,
-                    all_rulesets=all_rulesets,
-                )
+        all_rulesets = _load_all_rulesets()
+
+    if (rule_entry := _find_rule(rule_uuid, all_rulesets)) is not None:
+        return rule_entry
 
     raise ProblemException(
         status=404,
@@ -351,27 +380,24 @@ def delete_rule(param):
     user.need_permission("wato.edit")
     user.need_permission("wato.rulesets")
     rule_id = param["rule_id"]
-    rule: Rule
-    all_rulesets = AllRulesets.load_all_rulesets()
-
-    for ruleset in visible_rulesets(all_rulesets.get_rulesets()).values():
-        for _folder, _index, rule in ruleset.get_rules():
-            if rule.id == rule_id:
-                if is_locked_by_quick_setup(rule.locked_by):
-                    return problem(
-                        status=400,
-                        title="Rule is managed by Quick setup",
-                        detail="Rules managed by Quick setup cannot be deleted.",
-                    )
-                ruleset.delete_rule(rule)
-                all_rulesets.save()
-                return http.Response(status=204)
 
-    return problem(
-        status=404,
-        title="Rule not found.",
-        detail=f"The rule with ID {rule_id!r} could not be found.",
-    )
+    if (rule_entry := _find_rule(rule_id, _load_all_rulesets())) is None:
+        return problem(
+            status=404,
+            title="Rule not found.",
+            detail=f"The rule with ID {rule_id!r} could not be found.",
+        )
+
+    if is_locked_by_quick_setup(rule_entry.rule.locked_by):
+        return problem(
+            status=400,
+            title="Rule is managed by Quick setup",
+            detail="Rules managed by Quick setup cannot be deleted.",
+        )
+
+    rule_entry.ruleset.delete_rule(rule_entry.rule)
+    rule_entry.all_rulesets.save()
+    return http.Response(status=204)
 
 
 @Endpoint(
@@ -428,13 +454,13 @@ def edit_rule(param):
     ruleset.edit_rule(current_rule, new_rule)
     rulesets.save_folder(folder)
 
-    new_rule_entry = _get_rule_by_id(param["rule_id"])
-    return serve_json(_serialize_rule(new_rule_entry))
+    # The edited rule replaces the current one at the same position
+    return serve_json(_serialize_rule(dataclasses.replace(rule_entry, rule=new_rule)))
 
 
 def _validate_value(ruleset: Ruleset, value: Any) -> None:
     try:
-        valuespec = ruleset.valuespec()
+        valuespec = _valuespec(ruleset)
         valuespec.validate_datatype(value, "")
         valuespec.validate_value(value, "")
 
@@ -500,7 +526,7 @@ def _create_rule(
     conditions: dict[str, Any],
     properties: RuleOptionsSpec,
     value: Any,
-    rule_id: str = gen_id(),
+    rule_id: str,
 ) -> Rule:
     rule = Rule(
         rule_id,
@@ -552,6 +578,7 @@ def _serialize_rule(
     rule_entry: RuleEntry, *, include_links: bool = True, include_extensions: bool = True
 ) -> DomainObject:
     rule = rule_entry.rule
+    conditions = rule.conditions
     return constructors.domain_object(
         domain_type="rule",
         editable=False,
@@ -563,18 +590,21 @@ def _serialize_rule(
                 "folder": "/" + rule_entry.folder.path(),
                 "folder_index": rule_entry.index_nr,
                 "properties": rule.rule_options.to_config(),
-                "value_raw": repr(rule.ruleset.valuespec().mask(rule.value)),
-                "conditions": denilled(
-                    {
-                        "host_name": rule.conditions.host_name,
-                        "host_tags": rule.conditions.host_tags,
-                        "host_label_groups": _internal_to_api(rule.conditions.host_label_groups),
-                        "service_description": rule.conditions.service_description,
-                        "service_label_groups": _internal_to_api(
-                            rule.conditions.service_label_groups
+                "value_raw": repr(_valuespec(rule.ruleset).mask(rule.value)),
+                "conditions": {
+                    key: value
+                    for key, value in (
+                        ("host_name", conditions.host_name),
+                        ("host_tags", conditions.host_tags),
+                        ("host_label_groups", _internal_to_api(conditions.host_label_groups)),
+                        ("service_description", conditions.service_description),
+                        (
+                            "service_label_groups",
+                            _internal_to_api(conditions.service_label_groups),
                         ),
-                    }
-                ),
+                    )
+                    if value is not None
+                },
             }
             if include_extensions
             else None
@@ -27,12 +27,12 @@ from cmk.gui.type_defs import UserSpec
 from cmk.gui.userdb import (
     ConnectorType,
     htpasswd,
-    load_connection_config,
+    load_connection_types,
     load_users,
     locked_attributes,
 )
 from cmk.gui.utils import permission_verification as permissions
-from cmk.gui.watolib.custom_attributes import load_custom_attrs_from_mk_file
+from cmk.gui.watolib.custom_attributes import load_custom_user_attrs_for_reading
 from cmk.gui.watolib.users import (
     delete_users,
     edit_users,
@@ -111,7 +111,10 @@ def list_users(params: Mapping[str, Any]) -> Response:
     include_extensions: bool = params["include_extensions"]
     users = [
         serialize_user(
-            user_id, spec, include_links=include_links, include_extensions=include_extensions
+            user_id,
+            spec,
+            include_links=include_links,
+            include_extensions=include_extensions,
         )
         for user_id, spec in load_users(False).items()
     ]
@@ -255,19 +258,25 @@ def serialize_user(
     )
 
 
+# These are either no user attributes or converted separately
+_API_ATTRIBUTES_NOT_COPIED = frozenset(
+    {
+        "username",
+        "customer",
+        "contact_options",
+        "auth_option",
+        "authorized_sites",
+        "idle_timeout",
+        "disable_notifications",
+        "interface_options",
+    }
+)
+
+
 def _api_to_internal_format(internal_attrs, api_configurations, new_user=False):
     attrs = internal_attrs.copy()
     for attr, value in api_configurations.items():
-        if attr in (
-            "username",
-            "customer",
-            "contact_options",
-            "auth_option",
-            "authorized_sites",
-            "idle_timeout",
-            "disable_notifications",
-            "interface_options",
-        ):
+        if attr in _API_ATTRIBUTES_NOT_COPIED:
             continue
         attrs[attr] = value
 
@@ -310,7 +319,7 @@ def _internal_to_api_format(  # pylint: disable=too-many-branches
     api_attrs["auth_option"] = _auth_options_to_api_format(internal_attrs)
     api_attrs.update(_notification_options_to_api_format(internal_attrs))
 
-    iia = InternalInterfaceAttributes()
+    iia: InternalInterfaceAttributes = {}
     if "ui_theme" in internal_attrs:
         iia["ui_theme"] = internal_attrs["ui_theme"]
     if "ui_sidebar_position" in internal_attrs:
@@ -341,21 +350,19 @@ def _internal_to_api_format(  # pylint: disable=too-many-branches
             internal_attrs["temperature_unit"]
         )
 
-    api_attrs.update(
-        {
-            k: v
-            for k, v in internal_attrs.items()
-            if k
-            in (
-                "roles",
-                "contactgroups",
-                "language",
-                "customer",
-            )
-        }
-    )
-    custom_attrs = load_custom_attrs_from_mk_file(lock=False)["user"]
-    for attr in custom_attrs:
+    if "roles" in internal_attrs:
+        api_attrs["roles"] = internal_attrs["roles"]
+
+    if "contactgroups" in internal_attrs:
+        api_attrs["contactgroups"] = internal_attrs["contactgroups"]
+
+    if "language" in internal_attrs:
+        api_attrs["language"] = internal_attrs["language"]
+
+    if "customer" in internal_attrs:
+        api_attrs["customer"] = internal_attrs["customer"]
+
+    for attr in load_custom_user_attrs_for_reading():
         if (name := attr["name"]) in internal_attrs:
             # monkeypatch a typed dict, what can go wrong
             api_attrs[name] = internal_attrs[name]  # type: ignore[literal-required]
@@ -399,9 +406,8 @@ def _auth_options_to_api_format(internal_attributes: UserSpec) -> APIAuthOption:
                 result["enforce_password_change"] = enforce_password_change
         return result
 
-    for connection in load_connection_config():
-        if connection["id"] == connector:
-            result["auth_type"] = connection["type"]
+    if connector is not None and (auth_type := load_connection_types().get(connector)) is not None:
+        result["auth_type"] = auth_type
 
     return result
 
@@ -489,8 +495,9 @@ def _update_auth_options(
     if auth_options.get("auth_type") == "remove":
         internal_attrs.pop("automation_secret", None)
         internal_attrs.pop("password", None)
-        internal_attrs["serial"] = 1
+        bump_serial = True
     else:
+        bump_serial = False
         internal_auth_attrs = _auth_options_to_internal_format(auth_options)
         if new_user and "password" not in internal_auth_attrs:
             # "password" (the password hash) is set for both automation users and regular users,
@@ -503,14 +510,16 @@ def _update_auth_options(
             # Note: Changing from password to automation secret leaves enforce_pw_change, although
             #       it will be ignored for automation users.
             internal_attrs.update(internal_auth_attrs)
-
-            if internal_auth_attrs.get("enforce_password_change"):
-                internal_attrs["serial"] = 1
-
-            if "password" in auth_options or "secret" in auth_options:
-                internal_attrs["serial"] = 1
+            bump_serial = (
+                bool(internal_auth_attrs.get("enforce_password_change"))
+                or "password" in auth_options
+                or "secret" in auth_options
+            )
 
         internal_attrs["connector"] = ConnectorType.HTPASSWD
+
+    if bump_serial:
+        internal_attrs["serial"] = 1
     return internal_attrs
 
 
@@ -614,42 +623,60 @@ def _update_idle_options(
     return internal_attrs
 
 
+_API_TO_INTERNAL_UI_THEME: Mapping[str, Literal["modern-dark", "facelift"] | None] = {
+    "default": None,
+    "dark": "modern-dark",
+    "light": "facelift",
+}
+_API_TO_INTERNAL_SIDEBAR_POSITION: Mapping[str, Literal["left"] | None] = {
+    "right": None,
+    "left": "left",
+}
+_API_TO_INTERNAL_NAV_HIDE_ICONS_TITLE: Mapping[str, Literal["hide"] | None] = {
+    "show": None,
+    "hide": "hide",
+}
+_API_TO_INTERNAL_ICONS_PER_ITEM: Mapping[str, Literal["entry"] | None] = {
+    "topic": None,
+    "entry": "entry",
+}
+_API_TO_INTERNAL_SHOW_MODE: Mapping[
+    str, Literal["default_show_less", "default_show_more", "enforce_show_more"] | None
+] = {
+    "default": None,
+    "default_show_less": "default_show_less",
+    "default_show_more": "default_show_more",
+    "enforce_show_more": "enforce_show_more",
+}
+
+
 def _interface_options_to_internal_format(
     api_interface_options: ApiInterfaceAttributes,
 ) -> InternalInterfaceAttributes:
-    internal_inteface_options = InternalInterfaceAttributes()
+    internal_inteface_options: InternalInterfaceAttributes = {}
     if theme := api_interface_options.get("interface_theme"):
-        internal_inteface_options["ui_theme"] = {
-            "default": None,
-            "dark": "modern-dark",
-            "light": "facelift",
-        }[theme]
+        internal_inteface_options["ui_theme"] = _API_TO_INTERNAL_UI_THEME[theme]
     if sidebar_position := api_interface_options.get("sidebar_position"):
-        internal_inteface_options["ui_sidebar_position"] = {"right": None, "left": "left"}[
+        internal_inteface_options["ui_sidebar_position"] = _API_TO_INTERNAL_SIDEBAR_POSITION[
             sidebar_position
         ]
     if show_icon_titles := api_interface_options.get("navigation_bar_icons"):
-        internal_inteface_options["nav_hide_icons_title"] = {"show": None, "hide": "hide"}[
+        internal_inteface_options["nav_hide_icons_title"] = _API_TO_INTERNAL_NAV_HIDE_ICONS_TITLE[
             show_icon_titles
         ]
     if mega_menu_icons := api_interface_options.get("mega_menu_icons"):
-        internal_inteface_options["icons_per_item"] = {"topic": None, "entry": "entry"}[
+        internal_inteface_options["icons_per_item"] = _API_TO_INTERNAL_ICONS_PER_ITEM[
             mega_menu_icons
         ]
     if show_mode := api_interface_options.get("show_mode"):
-        internal_inteface_options["show_mode"] = {
-            "default": None,
-            "default_show_less": "default_show_less",
-            "default_show_more": "default_show_more",
-            "enforce_show_more": "enforce_show_more",
-        }[show_mode]
+        internal_inteface_options["show_mode"] = _API_TO_INTERNAL_SHOW_MODE[show_mode]
     return internal_inteface_options
 
 
 def _interface_options_to_api_format(
     internal_interface_options: InternalInterfaceAttributes,
 ) -> ApiInterfaceAttributes:
-    attributes = ApiInterfaceAttributes()
+    attributes: ApiInterfaceAttributes = {}
     if "ui_sidebar_position" not in internal_interface_options:
         attributes["sidebar_position"] = "right"
     else:
@@ -705,58 +732,51 @@ class NotificationDetails(TypedDict, total=False):
 
 
 def _update_notification_options(
-    internal_attrs: dict[str, Any], notification_options: NotificationDetails
+    internal_attrs: dict[str, Any], notification_options: NotificationDetails | None
 ) -> dict[str, Any]:
-    internal_attrs["disable_notifications"] = _notification_options_to_internal_format(
-        internal_attrs.get("disable_notifications", {}), notification_options
-    )
-    return internal_attrs
-
-
-def _notification_options_to_internal_format(
-    notification_internal: dict[str, bool | TIMESTAMP_RANGE],
-    notification_api_details: NotificationDetails,
-) -> dict[str, bool | TIMESTAMP_RANGE]:
-    """Format disable notifications information to be Checkmk compatible
+    """Apply the disable notifications information to the Checkmk user_attrs
 
     Args:
-        notification_api_details:
+        internal_attrs:
+            the Checkmk user_attrs to update
+        notification_options:
             user provided notifications details
 
     Returns:
-        formatted disable notifications details for Checkmk user_attrs
+        the user_attrs with Checkmk compatible disable notifications details
 
     Example:
-        >>> _notification_options_to_internal_format(
+        >>> _update_notification_options(
         ... {},
         ... {"timerange":{
         ... 'start_time': dt.datetime.strptime("2020-01-01T13:00:00Z", "%Y-%m-%dT%H:%M:%SZ"),
         ... 'end_time': dt.datetime.strptime("2020-01-01T14:00:00Z", "%Y-%m-%dT%H:%M:%SZ")
         ... }})
-        {'timerange': (1577883600.0, 1577887200.0)}
+        {'disable_notifications': {'timerange': (1577883600.0, 1577887200.0)}}
     """
-    if not notification_api_details:
-        return notification_internal
+    notification_internal: dict[str, bool | TIMESTAMP_RANGE] = internal_attrs.setdefault(
+        "disable_notifications", {}
+    )
+    if not notification_options:
+        return internal_attrs
 
-    if "timerange" in notification_api_details:
-        notification_internal["timerange"] = _time_stamp_range(
-            notification_api_details["timerange"]
-        )
+    if "timerange" in notification_options:
+        notification_internal["timerange"] = _time_stamp_range(notification_options["timerange"])
 
-    if "disable" in notification_api_details:
-        if notification_api_details["disable"]:
+    if "disable" in notification_options:
+        if notification_options["disable"]:
             notification_internal["disable"] = True
         else:
             notification_internal.pop("disable", None)
 
-    return notification_internal
+    return internal_attrs
 
 
 def _time_stamp_range(datetime_range: TimeRange) -> TIMESTAMP_RANGE:
-    def timestamp(date_time):
-        return dt.datetime.timestamp(date_time.replace(tzinfo=dt.timezone.utc))
-
-    return timestamp(datetime_range["start_time"]), timestamp(datetime_range["end_time"])
+    return (
+        datetime_range["start_time"].replace(tzinfo=dt.timezone.utc).timestamp(),
+        datetime_range["end_time"].replace(tzinfo=dt.timezone.utc).timestamp(),
+    )
 
 
 def _api_temperature_format_to_internal_format(
@@ -44,6 +44,7 @@ from ._connections import (
     LDAPConnectionConfigFixed,
     LDAPUserConnectionConfig,
     load_connection_config,
+    load_connection_types,
     locked_attributes,
     multisite_attributes,
     NAV_HIDE_ICONS_TITLE,
@@ -168,6 +169,7 @@ __all__ = [
     "is_valid_user_session",
     "ICONS_PER_ITEM",
     "load_connection_config",
+    "load_connection_types",
     "load_contacts",
     "load_custom_attr",
     "load_multisite_users",
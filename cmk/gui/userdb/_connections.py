@@ -211,6 +211,7 @@ def connections_by_type(connection_type: str) -> list[dict[str, Any]]:
 
 def clear_user_connection_cache() -> None:
     get_connection.cache_clear()  # type: ignore[attr-defined]
+    load_connection_types.cache_clear()  # type: ignore[attr-defined]
 
 
 def active_connections() -> list[tuple[str, UserConnector]]:
@@ -332,6 +333,12 @@ def load_connection_config(lock: bool = False) -> UserConnections:
     return UserConnectionConfigFile().load_for_reading()
 
 
+@request_memoize()
+def load_connection_types() -> Mapping[str, Literal["ldap", "saml2"]]:
+    """Map the ID of each configured user connection to its type"""
+    return {connection["id"]: connection["type"] for connection in load_connection_config()}
+
+
 def save_connection_config(connections: list[ConfigurableUserConnectionSpec]) -> None:
     """Save the connections for the Setup
 
@@ -4,6 +4,7 @@
 # conditions defined in the file COPYING, which is part of this source code package.
 import os
 import pprint
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Literal, TypedDict
 
@@ -11,6 +12,7 @@ from cmk.ccc import store
 
 from cmk.gui import userdb
 from cmk.gui.config import load_config
+from cmk.gui.hooks import request_memoize
 from cmk.gui.watolib.config_domain_name import wato_fileheader
 from cmk.gui.watolib.host_attributes import transform_pre_16_host_topics
 from cmk.gui.watolib.hosts_and_folders import folder_tree
@@ -74,6 +76,12 @@ def load_custom_attrs_from_mk_file(lock: bool) -> CustomAttrSpecs:
     )
 
 
+@request_memoize()
+def load_custom_user_attrs_for_reading() -> Sequence[CustomUserAttrSpec]:
+    """Load the custom user attributes once per request"""
+    return tuple(load_custom_attrs_from_mk_file(lock=False)["user"])
+
+
 def save_custom_attrs_to_mk_file(attrs: CustomAttrSpecs) -> None:
     output = wato_fileheader()
 
@@ -87,3 +95,4 @@ def save_custom_attrs_to_mk_file(attrs: CustomAttrSpecs) -> None:
 
     store.mkdir(multisite_dir())
     store.save_text_to_file(multisite_dir() + "custom_attrs.mk", output)
+    load_custom_user_attrs_for_reading.cache_clear()  # type: ignore[attr-defined]
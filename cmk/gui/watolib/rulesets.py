@@ -907,6 +907,7 @@ class Ruleset:
         index = folder_rules.index(orig_rule)
 
         folder_rules[index] = rule
+        self._rules_by_id[rule.id] = rule
 
         add_change(
             "edit-rule",
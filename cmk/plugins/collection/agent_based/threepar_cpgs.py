@@ -3,10 +3,9 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 from collections.abc import Mapping
+from dataclasses import dataclass
 from typing import Any
 
-import pydantic
-
 from cmk.agent_based.v2 import (
     AgentSection,
     CheckPlugin,
@@ -22,26 +21,26 @@ from cmk.plugins.lib.df import df_check_filesystem_single, FILESYSTEM_DEFAULT_PA
 from cmk.plugins.lib.threepar import parse_3par
 
 
-class SpaceUsage(pydantic.BaseModel):
+@dataclass(frozen=True, slots=True)
+class SpaceUsage:
     totalMiB: float
     usedMiB: float
 
     @property
-    def freeMiB(self):
+    def freeMiB(self) -> float:
         return self.totalMiB - self.usedMiB
 
 
-class ThreeparCPG(pydantic.BaseModel):
+@dataclass(frozen=True, slots=True)
+class ThreeparCPG:
     name: str
     state: int
-    num_fpvvs: int = pydantic.Field(alias="numFPVVs")  # number of Fully Provisioned Virtual Volumes
-    num_tdvvs: int = pydantic.Field(alias="numTDVVs")  # number of Thinly Deduped Virtual Volumes
-    num_tpvvs: int = pydantic.Field(
-        alias="numTPVVs"
-    )  # number of Thinly Provisioned Virtual Volumes
-    sa_usage: SpaceUsage = pydantic.Field(alias="SAUsage")  # Snapshot administration usage
-    sd_usage: SpaceUsage = pydantic.Field(alias="SDUsage")  # Snapshot data space usage
-    usr_usage: SpaceUsage = pydantic.Field(alias="UsrUsage")  # User data space usage
+    num_fpvvs: int  # number of Fully Provisioned Virtual Volumes
+    num_tdvvs: int  # number of Thinly Deduped Virtual Volumes
+    num_tpvvs: int  # number of Thinly Provisioned Virtual Volumes
+    sa_usage: SpaceUsage  # Snapshot administration usage
+    sd_usage: SpaceUsage  # Snapshot data space usage
+    usr_usage: SpaceUsage  # User data space usage
 
 
 ThreeparCPGSection = Mapping[str, ThreeparCPG]
@@ -53,11 +52,27 @@ _STATES = {
 }
 
 
+def _parse_space_usage(raw: Mapping[str, Any]) -> SpaceUsage:
+    return SpaceUsage(totalMiB=raw["totalMiB"], usedMiB=raw["usedMiB"])
+
+
 def parse_threepar_cpgs(string_table: StringTable) -> ThreeparCPGSection:
     if (raw_members := parse_3par(string_table).get("members")) is None:
         return {}
 
-    return {cpgs.get("name"): ThreeparCPG.model_validate(cpgs) for cpgs in raw_members}
+    return {
+        cpgs.get("name"): ThreeparCPG(
+            name=cpgs["name"],
+            state=cpgs["state"],
+            num_fpvvs=cpgs["numFPVVs"],
+            num_tdvvs=cpgs["numTDVVs"],
+            num_tpvvs=cpgs["numTPVVs"],
+            sa_usage=_parse_space_usage(cpgs["SAUsage"]),
+            sd_usage=_parse_space_usage(cpgs["SDUsage"]),
+            usr_usage=_parse_space_usage(cpgs["UsrUsage"]),
+        )
+        for cpgs in raw_members
+    }
 
 
 def count_threepar_vvs(cpg: ThreeparCPG) -> int:
@@ -80,7 +95,7 @@ def check_threepar_cpgs(item: str, section: ThreeparCPGSection) -> CheckResult:
     if (cpg := section.get(item)) is None:
         return
 
-    state, state_readable = _STATES[cpg.state]
+    state, state_readable = _STATES.get(cpg.state, (State.UNKNOWN, f"Unknown ({cpg.state})"))
     yield Result(state=state, summary=f"{state_readable}, {count_threepar_vvs(cpg)} VVs")
 
 
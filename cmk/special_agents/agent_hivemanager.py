@@ -5,7 +5,6 @@
 
 import argparse
 import base64
-import json
 import sys
 from collections.abc import Sequence
 
@@ -14,6 +13,26 @@ import requests
 from cmk.special_agents.v0_unstable.agent_common import special_agent_main
 from cmk.special_agents.v0_unstable.request_helper import HostnameValidationAdapter
 
+# (connect, read) timeout in seconds
+_TIMEOUT = (5, 30)
+
+_DEVICE_FIELDS = (
+    "hostName",
+    "clients",
+    "alarm",
+    "connection",
+    "upTime",
+    "eth0LLDPPort",
+    "eth0LLDPSysName",
+    "hive",
+    "hiveOS",
+    "hwmodel",
+    "serialNumber",
+    "nodeId",
+    "location",
+    "networkPolicy",
+)
+
 
 def main() -> int:
     return special_agent_main(_parse_arguments, _main)
@@ -50,35 +69,22 @@ def _main(args: argparse.Namespace) -> int:
     )
 
     try:
-        data = session.get(  # nosec B113 # BNS:0b0eac
+        response = session.get(
             f"https://{args.server}/hm/api/v1/devices",
-        ).text
+            timeout=_TIMEOUT,
+        )
+        response.raise_for_status()
+        devices = response.json()
     except Exception as e:
         sys.stderr.write("Connection error: %s" % e)
         return 2
 
-    informations = [
-        "hostName",
-        "clients",
-        "alarm",
-        "connection",
-        "upTime",
-        "eth0LLDPPort",
-        "eth0LLDPSysName",
-        "hive",
-        "hiveOS",
-        "hwmodel",
-        "serialNumber",
-        "nodeId",
-        "location",
-        "networkPolicy",
-    ]
-
-    print("<<<hivemanager_devices:sep(124)>>>")
-    for line in json.loads(data):
-        if line["upTime"] == "":
-            line["upTime"] = "down"
-        print("|".join(map(str, [f"{x}::{y}" for x, y in line.items() if x in informations])))
+    lines = ["<<<hivemanager_devices:sep(124)>>>"]
+    for device in devices:
+        if device["upTime"] == "":
+            device["upTime"] = "down"
+        lines.append("|".join(f"{key}::{device[key]}" for key in _DEVICE_FIELDS if key in device))
+    sys.stdout.write("\n".join(lines) + "\n")
     return 0
 
 
@@ -89,15 +95,11 @@ def _session(
     password: str,
     cert_server_name: str | None,
 ) -> requests.Session:
+    auth_encoded = base64.b64encode(f"{username}:{password}".encode("utf-8")).decode("ascii")
     session = requests.session()
     session.headers.update(
         {
-            "Authorization": "Basic %s"
-            % (
-                base64.encodebytes(f"{username}:{password}".encode("utf-8"))
-                .decode("utf-8")
-                .replace("\n", "")
-            ),
+            "Authorization": f"Basic {auth_encoded}",
             "Content-Type": "application/json",
         }
     )
@@ -3,17 +3,21 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
+import shutil
+from collections.abc import Hashable
 from logging import Logger
 from pathlib import Path
 from typing import cast
 
 from cmk.utils import tty
 from cmk.utils.notify_types import (
-    EventRule,
     NotificationParameterGeneralInfos,
+    NotificationParameterID,
     NotificationParameterItem,
     NotificationParameterMethod,
     NotificationParameterSpecs,
+    NotifyPluginParamsDict,
+    PluginNameWithParameters,
 )
 from cmk.utils.paths import check_mk_config_dir, omd_root
 
@@ -26,6 +30,18 @@ from cmk.gui.watolib.notifications import (
 from cmk.update_config.registry import update_action_registry, UpdateAction
 
 
+def _freeze(value: object) -> Hashable:
+    """Build a hashable key that is equal for values that compare equal
+
+    The container type is part of the key, as a list never equals a tuple or a dict.
+    """
+    if isinstance(value, dict):
+        return dict, frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list | tuple):
+        return type(value), tuple(_freeze(v) for v in value)
+    return value
+
+
 class MigrateNotifications(UpdateAction):
     def __init__(self, name: str, title: str, sort_index: int) -> None:
         super().__init__(name=name, title=title, sort_index=sort_index)
@@ -33,9 +49,10 @@ class MigrateNotifications(UpdateAction):
         self._notifications_mk_backup_path: Path = omd_root / "notifications_backup.mk"
 
     def __call__(self, logger: Logger) -> None:
+        rule_config_file = NotificationRuleConfigFile()
+        notification_rules = rule_config_file.load_for_reading()
         if all(
-            isinstance(event_rule["notify_plugin"][1], str)
-            for event_rule in NotificationRuleConfigFile().load_for_reading()
+            isinstance(event_rule["notify_plugin"][1], str) for event_rule in notification_rules
         ):
             logger.debug("       Already migrated")
             return
@@ -45,56 +62,52 @@ class MigrateNotifications(UpdateAction):
         logger.debug("       Finished backup of existing notification configuration.")
 
         parameters_per_method: NotificationParameterSpecs = {}
-        updated_notification_rules: list[EventRule] = []
-        for nr, rule in enumerate(NotificationRuleConfigFile().load_for_reading()):
-            method, parameter = rule["notify_plugin"]
+        # The migrated parameters by their frozen properties, to find duplicates quickly
+        parameter_ids_per_method: dict[
+            NotificationParameterMethod, dict[Hashable, NotificationParameterID]
+        ] = {}
+        for nr, rule in enumerate(notification_rules):
+            # Not yet migrated rules hold the plug-in parameters instead of their ID
+            method, parameter = cast(PluginNameWithParameters, rule["notify_plugin"])
 
             if parameter is None:
-                rule["notify_plugin"] = (method, parameter)
-                updated_notification_rules.append(rule)
                 continue
 
-            parameters_per_method.setdefault(
-                NotificationParameterMethod(method),
-                {},
-            )
-
-            parameter_id = [
-                param_id
-                for param_id, params in parameters_per_method[method].items()
-                if params["parameter_properties"] == parameter  # type: ignore[comparison-overlap]
-            ]
+            parameter_method = NotificationParameterMethod(method)
+            parameters = parameters_per_method.setdefault(parameter_method, {})
+            known_parameters = parameter_ids_per_method.setdefault(parameter_method, {})
 
-            if not parameter_id:
-                parameter_id = [sample_config.new_notification_parameter_id()]
+            parameter_key = _freeze(parameter)
+            if (parameter_id := known_parameters.get(parameter_key)) is None:
+                parameter_id = sample_config.new_notification_parameter_id()
 
                 # Call with the following parameter...
+                parameter_properties: NotifyPluginParamsDict
                 if isinstance(parameter, list):
-                    parameter = {"params": parameter}
-
-                parameters_per_method[method].update(
-                    {
-                        parameter_id[0]: NotificationParameterItem(
-                            general=NotificationParameterGeneralInfos(
-                                description="Migrated from notification rule #%d" % nr,
-                                comment="Auto migrated on update",
-                                docu_url="",
-                            ),
-                            parameter_properties=cast(dict, parameter),
-                        )
-                    }
+                    parameter_properties = {"params": parameter}
+                    parameter_key = _freeze(parameter_properties)
+                else:
+                    parameter_properties = parameter
+
+                known_parameters[parameter_key] = parameter_id
+                parameters[parameter_id] = NotificationParameterItem(
+                    general=NotificationParameterGeneralInfos(
+                        description=f"Migrated from notification rule #{nr}",
+                        comment="Auto migrated on update",
+                        docu_url="",
+                    ),
+                    parameter_properties=parameter_properties,
                 )
 
-            rule["notify_plugin"] = (method, parameter_id[0])
-            updated_notification_rules.append(rule)
+            rule["notify_plugin"] = (method, parameter_id)
 
         NotificationParameterConfigFile().save(parameters_per_method)
         logger.debug("       Saved migrated notification parameters")
-        NotificationRuleConfigFile().save(updated_notification_rules)
+        rule_config_file.save(notification_rules)
         logger.debug("       Saved migrated notification rules")
 
     def _backup_notification_config(self, logger: Logger) -> None:
-        self._notifications_mk_backup_path.write_text(self._notifications_mk_path.read_text())
+        shutil.copyfile(self._notifications_mk_path, self._notifications_mk_backup_path)
         logger.info(
             f"{tty.yellow}       Wrote notification configuration backup to\n"
             f"       {str(self._notifications_mk_backup_path)}.\n\n"
@@ -4,7 +4,7 @@
 # conditions defined in the file COPYING, which is part of this source code package.
 
 from datetime import datetime, timezone
-from functools import cache
+from functools import cache, lru_cache
 
 from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
 from cryptography.hazmat.primitives.asymmetric.types import CertificateIssuerPrivateKeyTypes
@@ -17,6 +17,7 @@ from cryptography.x509 import (
     CertificateSigningRequest,
     DNSName,
     load_pem_x509_certificate,
+    load_pem_x509_csr,
     random_serial_number,
     SubjectAlternativeName,
 )
@@ -30,6 +31,11 @@ def site_root_certificate() -> Certificate:
     return load_pem_x509_certificate(site_ca_path().read_bytes())
 
 
+@cache
+def site_root_certificate_pem() -> str:
+    return serialize_to_pem(site_root_certificate())
+
+
 def current_time_naive() -> datetime:
     """
     Create a not timezone aware, "naive", datetime at UTC now. This mimics the deprecated
@@ -76,6 +82,12 @@ def serialize_to_pem(certificate: Certificate | CertificateSigningRequest) -> st
     return certificate.public_bytes(Encoding.PEM).decode()
 
 
+@lru_cache(maxsize=1024)
+def load_pem_csr(pem: bytes) -> CertificateSigningRequest:
+    # Agents re-send the same CSR on retried registrations and renewals, so we only parse it once.
+    return load_pem_x509_csr(pem)
+
+
 def extract_cn_from_csr(csr: CertificateSigningRequest) -> str:
     v = csr.subject.get_attributes_for_oid(NameOID.COMMON_NAME)[0].value
     assert isinstance(v, str)
@@ -3,8 +3,9 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
+from collections.abc import Iterable, Iterator
 from enum import Enum
-from zlib import decompress
+from zlib import decompress, decompressobj
 from zlib import error as zlibError
 
 
@@ -22,6 +23,15 @@ class Decompressor(Enum):
         """
         return {Decompressor.ZLIB: Decompressor._zlib_decompress}[self](data)
 
+    def decompress_stream(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        >>> from zlib import compress
+        >>> data = compress(b"blablub")
+        >>> b"".join(Decompressor("zlib").decompress_stream([data[:3], data[3:]]))
+        b'blablub'
+        """
+        return {Decompressor.ZLIB: Decompressor._zlib_decompress_stream}[self](chunks)
+
     @staticmethod
     def _zlib_decompress(data: bytes) -> bytes:
         """
@@ -37,3 +47,30 @@ class Decompressor(Enum):
             return decompress(data)
         except zlibError as e:
             raise DecompressionError(f"Decompression with zlib failed: {e}") from e
+
+    @staticmethod
+    def _zlib_decompress_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        >>> from zlib import compress
+        >>> list(Decompressor._zlib_decompress_stream([b"blablub"]))
+        Traceback (most recent call last):
+            ...
+        cmk.agent_receiver.decompression.DecompressionError: ...
+        >>> list(Decompressor._zlib_decompress_stream([compress(b"blablub")[:-2]]))
+        Traceback (most recent call last):
+            ...
+        cmk.agent_receiver.decompression.DecompressionError: ...
+        """
+        decompressor = decompressobj()
+        try:
+            for chunk in chunks:
+                if data := decompressor.decompress(chunk):
+                    yield data
+            if data := decompressor.flush():
+                yield data
+        except zlibError as e:
+            raise DecompressionError(f"Decompression with zlib failed: {e}") from e
+        if not decompressor.eof:
+            raise DecompressionError(
+                "Decompression with zlib failed: incomplete or truncated stream"
+            )
@@ -4,15 +4,17 @@
 # conditions defined in the file COPYING, which is part of this source code package.
 
 import os
-import tempfile
-from functools import cache
+import threading
+from collections.abc import Iterable
+from functools import partial
 from pathlib import Path
-from typing import assert_never
+from typing import assert_never, Final
 
 from cryptography.x509 import Certificate
 from fastapi import Depends, File, Header, HTTPException, Response, UploadFile
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from pydantic import UUID4
+from starlette.concurrency import run_in_threadpool
 from starlette.status import (
     HTTP_204_NO_CONTENT,
     HTTP_400_BAD_REQUEST,
@@ -29,7 +31,7 @@ from .certs import (
     extract_cn_from_csr,
     serialize_to_pem,
     sign_agent_csr,
-    site_root_certificate,
+    site_root_certificate_pem,
 )
 from .checkmk_rest_api import (
     cmk_edition,
@@ -78,6 +80,8 @@ from .utils import (
 
 security = HTTPBasic()
 
+_AGENT_DATA_CHUNK_SIZE: Final = 65536
+
 
 def _validate_uuid_against_csr(uuid: UUID4, csr_field: CsrField) -> None:
     if str(uuid) != (cn := extract_cn_from_csr(csr_field.csr)):
@@ -99,22 +103,17 @@ def _sign_agent_csr(uuid: UUID4, csr_field: CsrField) -> Certificate:
     )
 
 
-@cache
-def _pem_serizialized_site_root_cert() -> str:
-    return serialize_to_pem(site_root_certificate())
-
-
 @AGENT_RECEIVER_APP.post(
     "/register_existing",
     response_model=RegisterExistingResponse,
 )
-async def register_existing(
+def register_existing(
     *,
     credentials: HTTPBasicCredentials = Depends(security),
     registration_body: RegisterExistingBody,
 ) -> RegisterExistingResponse:
     _validate_uuid_against_csr(registration_body.uuid, registration_body.csr)
-    root_cert = _pem_serizialized_site_root_cert()
+    root_cert = site_root_certificate_pem()
     agent_cert = serialize_to_pem(
         _sign_agent_csr(
             registration_body.uuid,
@@ -140,7 +139,7 @@ async def register_existing(
 
 
 @AGENT_RECEIVER_APP.post("/pairing", response_model=PairingResponse)
-async def pairing(
+def pairing(
     *,
     credentials: HTTPBasicCredentials = Depends(security),
     pairing_body: PairingBody,
@@ -169,12 +168,12 @@ async def pairing(
 
 
 def _validate_registration_request(host_config: HostConfiguration) -> None:
-    if host_config.site != site_name():
+    if host_config.site != (site := site_name()):
         raise HTTPException(
             status_code=HTTP_403_FORBIDDEN,
             detail=(
                 f"This host is monitored on the site {host_config.site}, "
-                f"but you tried to register it at the site {site_name()}."
+                f"but you tried to register it at the site {site}."
             ),
         )
     if host_config.is_cluster:
@@ -188,7 +187,7 @@ def _validate_registration_request(host_config: HostConfiguration) -> None:
     "/register_with_hostname",
     status_code=HTTP_204_NO_CONTENT,
 )
-async def register_with_hostname(
+def register_with_hostname(
     *,
     credentials: HTTPBasicCredentials = Depends(security),
     registration_body: RegistrationWithHNBody,
@@ -218,7 +217,7 @@ async def register_with_hostname(
     "/register_new",
     response_model=RegisterNewResponse,
 )
-async def register_new(
+def register_new(
     *,
     credentials: HTTPBasicCredentials = Depends(security),
     registration_body: RegisterNewBody,
@@ -226,7 +225,7 @@ async def register_new(
     _validate_is_allowed(credentials, registration_body.uuid)
     _validate_uuid_against_csr(registration_body.uuid, registration_body.csr)
 
-    root_cert = _pem_serizialized_site_root_cert()
+    root_cert = site_root_certificate_pem()
 
     R4R(
         status=R4RStatus.NEW,
@@ -257,7 +256,7 @@ async def register_new(
     | RegisterNewOngoingResponseDeclined
     | RegisterNewOngoingResponseSuccess,
 )
-async def register_new_ongoing(
+def register_new_ongoing(
     uuid: UUID4,
     *,
     credentials: HTTPBasicCredentials = Depends(security),
@@ -348,20 +347,33 @@ def _validate_is_allowed(credentials: HTTPBasicCredentials, uuid: UUID4) -> None
         )
 
 
-def _store_agent_data(
+def _store_agent_data_stream(
     target_dir: Path,
-    decompressed_data: bytes,
+    decompressed_chunks: Iterable[bytes],
 ) -> None:
-    target_dir.resolve().mkdir(parents=True, exist_ok=True)
-    with tempfile.NamedTemporaryFile(
-        dir=target_dir,
-        delete=False,
-    ) as temp_file:
-        try:
-            temp_file.write(decompressed_data)
-            os.rename(temp_file.name, target_dir / "agent_output")
-        finally:
-            Path(temp_file.name).unlink(missing_ok=True)
+    # The thread ID is unique system-wide, so concurrent uploads never share a temporary file.
+    temp_path = target_dir / f".agent_output.{threading.get_native_id()}.tmp"
+    try:
+        fd = _open_private(temp_path)
+    except FileNotFoundError:
+        # If the host is still registered, only the directory its symlink points to is missing.
+        # Never create a real directory in place of a removed symlink.
+        if not target_dir.is_symlink():
+            raise
+        target_dir.resolve().mkdir(parents=True, exist_ok=True)
+        fd = _open_private(temp_path)
+    try:
+        with os.fdopen(fd, "wb") as temp_file:
+            for chunk in decompressed_chunks:
+                temp_file.write(chunk)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    os.replace(temp_path, target_dir / "agent_output")
+
+
+def _open_private(path: Path) -> int:
+    return os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
 
 
 @UUID_VALIDATION_ROUTER.post(
@@ -409,7 +421,16 @@ async def agent_data(
         ) from e
 
     try:
-        decompressed_agent_data = decompressor(monitoring_data.file.read())
+        # Decompress and write in bounded chunks on the threadpool, so that neither the
+        # compressed nor the decompressed payload is fully held in memory, and concurrent
+        # pushes do not block the event loop.
+        await run_in_threadpool(
+            _store_agent_data_stream,
+            host.source_path,
+            decompressor.decompress_stream(
+                iter(partial(monitoring_data.file.read, _AGENT_DATA_CHUNK_SIZE), b"")
+            ),
+        )
     except DecompressionError as e:
         logger.error(
             "uuid=%s Decompression of agent data failed: %s",
@@ -421,11 +442,6 @@ async def agent_data(
             detail="Decompression of agent data failed",
         ) from e
 
-    _store_agent_data(
-        host.source_path,
-        decompressed_agent_data,
-    )
-
     logger.info(
         "uuid=%s Agent data saved",
         uuid,
@@ -437,7 +453,7 @@ async def agent_data(
     "/registration_status/{uuid}",
     response_model=RegistrationStatus,
 )
-async def registration_status(
+def registration_status(
     uuid: UUID4,
 ) -> RegistrationStatus:
     try:
@@ -469,7 +485,7 @@ async def registration_status(
     response_model=RegistrationStatusV2ResponseNotRegistered
     | RegistrationStatusV2ResponseRegistered,
 )
-async def registration_status_v2(
+def registration_status_v2(
     uuid: UUID4,
 ) -> RegistrationStatusV2ResponseNotRegistered | RegistrationStatusV2ResponseRegistered:
     try:
@@ -486,7 +502,7 @@ async def registration_status_v2(
     "/renew_certificate/{uuid}",
     response_model=RenewCertResponse,
 )
-async def renew_certificate(
+def renew_certificate(
     *,
     uuid: UUID4,
     cert_renewal_body: CertificateRenewalBody,
@@ -8,6 +8,7 @@ from fastapi import FastAPI
 # NOTE: The import below is a hack, we should register endpoints explicitly!
 from . import endpoints  # noqa: F401 # pylint: disable=unused-import
 from .apps_and_routers import AGENT_RECEIVER_APP, UUID_VALIDATION_ROUTER
+from .certs import site_root_certificate_pem
 from .log import configure_logger
 from .site_context import log_path, site_name
 
@@ -15,6 +16,9 @@ from .site_context import log_path, site_name
 def main_app() -> FastAPI:
     configure_logger(log_path())
 
+    # load and serialize the root certificate now instead of during the first registration
+    site_root_certificate_pem()
+
     # this must happen *after* registering the endpoints
     AGENT_RECEIVER_APP.include_router(UUID_VALIDATION_ROUTER)
 
@@ -13,12 +13,12 @@ from enum import Enum
 from typing import Literal, override, Self
 from uuid import UUID
 
-from cryptography.x509 import CertificateSigningRequest, load_pem_x509_csr
+from cryptography.x509 import CertificateSigningRequest
 from fastapi import HTTPException
 from pydantic import BaseModel, field_validator, GetCoreSchemaHandler, UUID4
 from pydantic_core import core_schema
 
-from .certs import extract_cn_from_csr
+from .certs import extract_cn_from_csr, load_pem_csr
 
 
 @dataclass(frozen=True)
@@ -42,7 +42,7 @@ class CsrField:
         else:
             if not isinstance(v, str):
                 raise TypeError("CertificateSigningRequest or string required")
-            csr = load_pem_x509_csr(v.encode())
+            csr = load_pem_csr(v.encode())
         if not csr.is_signature_valid:
             raise ValueError("Invalid CSR (signature and public key do not match)")
         try:
@@ -9,10 +9,9 @@ from contextlib import suppress
 from dataclasses import dataclass
 from typing import Final, NewType, Self
 
-from cryptography.x509 import load_pem_x509_csr
-from cryptography.x509.oid import NameOID
 from pydantic import UUID4
 
+from .certs import extract_cn_from_csr, load_pem_csr
 from .models import ConnectionMode, R4RStatus, RequestForRegistration
 from .site_context import agent_output_dir, internal_secret_path, r4r_dir
 
@@ -41,13 +40,17 @@ class R4R:
     @classmethod
     def read(cls, uuid: UUID4) -> Self:
         for status in R4RStatus:
-            if (path := r4r_dir() / status.name / f"{uuid}.json").exists():
-                with open(path, encoding="utf-8") as file:
-                    request = RequestForRegistration.model_validate_json(file.read())
-                # access time is used to determine when to remove registration request file
-                with suppress(OSError):
-                    os.utime(path, None)
-                return cls(status, request)
+            path = r4r_dir() / status.name / f"{uuid}.json"
+            try:
+                raw_request = path.read_bytes()
+            except FileNotFoundError:
+                continue
+            # pydantic parses the raw JSON bytes directly, no need to decode them first
+            request = RequestForRegistration.model_validate_json(raw_request)
+            # access time is used to determine when to remove registration request file
+            with suppress(OSError):
+                os.utime(path, None)
+            return cls(status, request)
         raise FileNotFoundError(f"No request for registration with UUID {uuid} found")
 
     def write(self) -> None:
@@ -65,13 +68,7 @@ class R4R:
 
 def uuid_from_pem_csr(pem_csr: str) -> str:
     try:
-        v = (
-            load_pem_x509_csr(pem_csr.encode())
-            .subject.get_attributes_for_oid(NameOID.COMMON_NAME)[0]
-            .value
-        )
-        assert isinstance(v, str)
-        return v
+        return extract_cn_from_csr(load_pem_csr(pem_csr.encode()))
     except ValueError:
         return "[CSR parsing failed]"
 
@@ -20,6 +20,7 @@ from pytest_mock import MockerFixture
 from cmk.agent_receiver import site_context
 from cmk.agent_receiver.certs import serialize_to_pem
 from cmk.agent_receiver.checkmk_rest_api import CMKEdition, HostConfiguration, RegisterResponse
+from cmk.agent_receiver.endpoints import _store_agent_data_stream
 from cmk.agent_receiver.models import ConnectionMode, R4RStatus, RequestForRegistration
 from cmk.agent_receiver.utils import R4R
 
@@ -683,6 +684,80 @@ def test_agent_data_success(
     assert response.status_code == 204
 
 
+def test_agent_data_success_target_dir_missing(
+    tmp_path: Path,
+    client: TestClient,
+    uuid: UUID4,
+    agent_data_headers: MutableMapping[str, str],
+    compressed_agent_data: io.BytesIO,
+) -> None:
+    source = site_context.agent_output_dir() / str(uuid)
+    source.symlink_to(tmp_path / "push-agent" / "hostname")
+
+    response = client.post(
+        f"/agent_data/{uuid}",
+        headers=agent_data_headers,
+        files={"monitoring_data": ("filename", compressed_agent_data)},
+    )
+
+    file_path = tmp_path / "push-agent" / "hostname" / "agent_output"
+    assert file_path.read_text() == "mock file"
+    assert stat.S_IMODE(file_path.stat().st_mode) == 0o600
+
+    assert response.status_code == 204
+
+
+def test_store_agent_data_stream_symlink_missing(uuid: UUID4) -> None:
+    source = site_context.agent_output_dir() / str(uuid)
+
+    with pytest.raises(FileNotFoundError):
+        _store_agent_data_stream(source, (b"mock file",))
+
+    assert not source.exists()
+    assert not source.is_symlink()
+
+
+@pytest.mark.usefixtures("symlink_push_host")
+def test_agent_data_success_multiple_chunks(
+    tmp_path: Path,
+    client: TestClient,
+    uuid: UUID4,
+    agent_data_headers: MutableMapping[str, str],
+) -> None:
+    agent_output = b"".join(b"<<<section_%d>>>\n" % i for i in range(100000))
+    response = client.post(
+        f"/agent_data/{uuid}",
+        headers=agent_data_headers,
+        files={"monitoring_data": ("filename", io.BytesIO(compress(agent_output)))},
+    )
+
+    file_path = tmp_path / "push-agent" / "hostname" / "agent_output"
+    assert file_path.read_bytes() == agent_output
+
+    assert response.status_code == 204
+
+
+@pytest.mark.usefixtures("symlink_push_host")
+def test_agent_data_invalid_data_keeps_previous_output(
+    tmp_path: Path,
+    client: TestClient,
+    uuid: UUID4,
+    agent_data_headers: MutableMapping[str, str],
+) -> None:
+    target_dir = tmp_path / "push-agent" / "hostname"
+    (target_dir / "agent_output").write_bytes(b"previous output")
+
+    response = client.post(
+        f"/agent_data/{uuid}",
+        headers=agent_data_headers,
+        files={"monitoring_data": ("filename", io.BytesIO(compress(b"mock file")[:-4]))},
+    )
+
+    assert response.status_code == 400
+    assert [p.name for p in target_dir.iterdir()] == ["agent_output"]
+    assert (target_dir / "agent_output").read_bytes() == b"previous output"
+
+
 @pytest.fixture(name="registration_status_headers")
 def fixture_registration_status_headers(uuid: UUID4) -> dict[str, str]:
     return {
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# Copyright (C) 2024 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+from collections.abc import Sequence
+
+import pytest
+
+from .checktestlib import Check
+
+_STRING_TABLE = [
+    ["LUN", "PATH", "INFORMATION", "FOR", "LUN", ":", "/dev/rdisk/disk781"],
+    ["World", "Wide", "Identifier(WWID)", "=", "0x600508b4000139e500009000075e00e0"],
+    ["State", "=", "ACTIVE"],
+    ["State", "=", "OPENING"],
+    ["State", "=", "STANDBY"],
+    ["State", "=", "UNOPEN"],
+    ["LUN", "PATH", "INFORMATION", "FOR", "LUN", ":", "/dev/rdisk/disk912"],
+    ["World", "Wide", "Identifier(WWID)", "=", "0x600508b4000139e500009000075e00f0"],
+    ["State", "=", "ACTIVE"],
+    ["State", "=", "FAILED"],
+]
+
+
+@pytest.mark.parametrize(
+    "item, params, expected_result",
+    [
+        pytest.param(
+            "0x600508b4000139e500009000075e00e0",
+            {"expected": (2, 1, 0, 1)},
+            [(0, "/dev/rdisk/disk781: 2 ACTIVE, 1 STANDBY, 1 UNOPEN")],
+            id="ok",
+        ),
+        pytest.param(
+            "0x600508b4000139e500009000075e00e0",
+            {"expected": (2, 2, 0, 0)},
+            [
+                (
+                    1,
+                    "/dev/rdisk/disk781: Invalid path status 2 ACTIVE, 1 STANDBY, 1 UNOPEN"
+                    " (should be 2 ACTIVE, 2 STANDBY)",
+                )
+            ],
+            id="unexpected",
+        ),
+        pytest.param(
+            "0x600508b4000139e500009000075e00f0",
+            {"expected": (2, 0, 0, 0)},
+            [(2, "/dev/rdisk/disk912: 1 failed paths! (1 ACTIVE, 1 FAILED)")],
+            id="failed",
+        ),
+    ],
+)
+def test_check_hpux_multipath(
+    item: str, params: object, expected_result: Sequence[tuple[int, str]]
+) -> None:
+    check = Check("hpux_multipath")
+    assert list(check.run_check(item, params, check.run_parse(_STRING_TABLE))) == expected_result
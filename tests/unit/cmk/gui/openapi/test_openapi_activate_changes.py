@@ -79,14 +79,14 @@ def test_activate_changes(
         with mock_livestatus(expect_status_query=True):
             resp = clients.ActivateChanges.activate_changes()
 
-    assert set(resp.json["extensions"]) == {
+    assert resp.json["extensions"].keys() == {
         "sites",
         "is_running",
         "force_foreign_changes",
         "time_started",
         "changes",
     }
-    assert set(resp.json["extensions"]["changes"][0]) == {
+    assert resp.json["extensions"]["changes"][0].keys() == {
         "id",
         "user_id",
         "action_name",
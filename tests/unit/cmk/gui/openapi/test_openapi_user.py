@@ -1211,7 +1211,7 @@ def fixture_mock_user_connections_config(mocker: MockerFixture) -> MagicMock:
 
     """
     return mocker.patch(
-        "cmk.gui.openapi.endpoints.user_config.load_connection_config",
+        "cmk.gui.userdb._connections.load_connection_config",
         # not reflective of actual SAML connector
         return_value=[{"id": MOCK_SAML_CONNECTOR_NAME, "name": "bla", "type": "saml2"}],
     )
@@ -85,6 +85,16 @@ def test_discover_threepar_cpgs(
             [Result(state=State.CRIT, summary="Failed, 16 VVs")],
             id="If the state of the disk is 3, the check result is CRIT (Failed) and information about how many VVs are available is displayed.",
         ),
+        pytest.param(
+            [
+                [
+                    '{"total": 1,"members": [{"id": 0,"uuid": "b5611ec3-b459-4cfe-91d8-64b6c074e72b","name": "SSD_R6","numFPVVs": 1,"numTPVVs": 0,"numTDVVs": 15,"UsrUsage": {"totalMiB": 20261120,"rawTotalMiB": 24313343,"usedMiB": 20261120,"rawUsedMiB": 24313343},"SAUsage": {"totalMiB": 104448,"rawTotalMiB": 313344,"usedMiB": 94976,"rawUsedMiB": 284928},"SDUsage": {"totalMiB": 44800,"rawTotalMiB": 53760,"usedMiB": 25600,"rawUsedMiB": 30719},"state": 4}]}'
+                ]
+            ],
+            "SSD_R6",
+            [Result(state=State.UNKNOWN, summary="Unknown (4), 16 VVs")],
+            id="If the state of the disk is not known, the check result is UNKNOWN.",
+        ),
     ],
 )
 def test_check_3par_cpgs(